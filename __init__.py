@@ -1,26 +1,34 @@
 """The Tesla Powerwall integration."""
 from __future__ import annotations
 
+import asyncio
 import contextlib
 from datetime import timedelta
 import logging
+from typing import Any
 
-import requests
+from aiohttp import ClientSession, CookieJar
 from tesla_powerwall import (
     AccessDeniedError,
-    APIError,
+    ApiError,
+    GridStatus,
     MissingAttributeError,
     Powerwall,
     PowerwallError,
+    PowerwallStatusResponse,
     PowerwallUnreachableError,
+    SiteInfoResponse,
+    assert_attribute,
 )
 
 from homeassistant.components import persistent_notification
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_IP_ADDRESS, CONF_PASSWORD, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util.network import is_ip_address
 
@@ -42,6 +50,8 @@ _LOGGER = logging.getLogger(__name__)
 
 MAX_LOGIN_FAILURES = 5
 
+BASE_INFO_STORAGE_VERSION = 1
+
 API_CHANGED_ERROR_BODY = (
     "It seems like your powerwall uses an unsupported version. "
     "Please update the software of your powerwall or if it is "
@@ -57,13 +67,11 @@ class PowerwallDataManager:
         self,
         hass: HomeAssistant,
         power_wall: Powerwall,
-        ip_address: str,
         password: str | None,
         runtime_data: PowerwallRuntimeData,
     ) -> None:
         """Init the data manager."""
         self.hass = hass
-        self.ip_address = ip_address
         self.password = password
         self.runtime_data = runtime_data
         self.power_wall = power_wall
@@ -84,51 +92,59 @@ class PowerwallDataManager:
     def _clear_failed_logins(self) -> None:
         self.runtime_data[POWERWALL_LOGIN_FAILED_COUNT] = 0
 
-    def _recreate_powerwall_login(self) -> None:
+    async def _recreate_powerwall_login(self) -> None:
         """Recreate the login on auth failure."""
-        http_session = self.runtime_data[POWERWALL_HTTP_SESSION]
-        http_session.close()
-        http_session = requests.Session()
-        self.runtime_data[POWERWALL_HTTP_SESSION] = http_session
-        self.power_wall = Powerwall(self.ip_address, http_session=http_session)
-        self.power_wall.login(self.password or "")
+        # Login again on the existing session so the pooled
+        # keep-alive connection to the powerwall is reused,
+        # only dropping the stale auth cookie
+        self.runtime_data[POWERWALL_HTTP_SESSION].cookie_jar.clear()
+        await self.power_wall.login(self.password or "")
 
     async def async_update_data(self) -> PowerwallData:
         """Fetch data from API endpoint."""
+        _LOGGER.debug(
+            "Updating data, api changed: %s, failed logins: %s",
+            self.api_changed,
+            self.login_failed_count,
+        )
         # Check if we had an error before
-        _LOGGER.debug("Checking if update failed")
         if self.api_changed:
             raise UpdateFailed("The powerwall api has changed")
-        return await self.hass.async_add_executor_job(self._update_data)
+        return await self._update_data()
 
-    def _update_data(self) -> PowerwallData:
+    async def _update_data(self) -> PowerwallData:
         """Fetch data from API endpoint."""
-        _LOGGER.debug("Updating data")
         for attempt in range(2):
             try:
                 if attempt == 1:
-                    self._recreate_powerwall_login()
-                data = _fetch_powerwall_data(self.power_wall)
+                    await self._recreate_powerwall_login()
+                data = await _fetch_powerwall_data(self.power_wall)
             except PowerwallUnreachableError as err:
                 raise UpdateFailed("Unable to fetch data from powerwall") from err
             except MissingAttributeError as err:
                 _LOGGER.error("The powerwall api has changed: %s", str(err))
                 # The error might include some important information about what exactly changed.
-                persistent_notification.create(
+                persistent_notification.async_create(
                     self.hass, API_CHANGED_ERROR_BODY, API_CHANGED_TITLE
                 )
                 self.runtime_data[POWERWALL_API_CHANGED] = True
+                # Polling will not recover from this, stop until the entry is reloaded
+                if coordinator := self.runtime_data[POWERWALL_COORDINATOR]:
+                    coordinator.update_interval = None
                 raise UpdateFailed("The powerwall api has changed") from err
             except AccessDeniedError as err:
-                if attempt == 1:
-                    self._increment_failed_logins()
-                    raise ConfigEntryAuthFailed from err
                 if self.password is None:
                     raise ConfigEntryAuthFailed from err
+                if attempt == 0:
+                    # The auth cookie may have expired, login again and retry
+                    continue
+                self._increment_failed_logins()
+                if self.login_failed_count >= MAX_LOGIN_FAILURES:
+                    raise ConfigEntryAuthFailed from err
                 raise UpdateFailed(
                     f"Login attempt {self.login_failed_count}/{MAX_LOGIN_FAILURES} failed, will retry: {err}"
                 ) from err
-            except APIError as err:
+            except ApiError as err:
                 raise UpdateFailed(f"Updated failed due to {err}, will retry") from err
             else:
                 self._clear_failed_logins()
@@ -138,20 +154,22 @@ class PowerwallDataManager:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Tesla Powerwall from a config entry."""
-    http_session = requests.Session()
+    http_session = _async_create_http_session(hass)
     ip_address = entry.data[CONF_IP_ADDRESS]
 
     password = entry.data.get(CONF_PASSWORD)
     power_wall = Powerwall(ip_address, http_session=http_session)
+    base_info_store = _async_get_base_info_store(hass, entry)
+    cached_base_info_data = await base_info_store.async_load()
     try:
-        base_info = await hass.async_add_executor_job(
-            _login_and_fetch_base_info, power_wall, ip_address, password
+        base_info, base_info_data = await _login_and_fetch_base_info(
+            power_wall, ip_address, password, cached_base_info_data
         )
     except PowerwallUnreachableError as err:
-        http_session.close()
+        await http_session.close()
         raise ConfigEntryNotReady from err
     except MissingAttributeError as err:
-        http_session.close()
+        await http_session.close()
         # The error might include some important information about what exactly changed.
         _LOGGER.error("The powerwall api has changed: %s", str(err))
         persistent_notification.async_create(
@@ -160,9 +178,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         return False
     except AccessDeniedError as err:
         _LOGGER.debug("Authentication failed", exc_info=err)
-        http_session.close()
+        await http_session.close()
         raise ConfigEntryAuthFailed from err
 
+    if base_info_data is not None:
+        await base_info_store.async_save(base_info_data)
+
     gateway_din = base_info.gateway_din
     if gateway_din and entry.unique_id is not None and is_ip_address(entry.unique_id):
         hass.config_entries.async_update_entry(entry, unique_id=gateway_din)
@@ -175,7 +196,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         coordinator=None,
     )
 
-    manager = PowerwallDataManager(hass, power_wall, ip_address, password, runtime_data)
+    manager = PowerwallDataManager(hass, power_wall, password, runtime_data)
 
     coordinator = DataUpdateCoordinator(
         hass,
@@ -185,51 +206,160 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         update_interval=timedelta(seconds=UPDATE_INTERVAL),
     )
 
-    await coordinator.async_config_entry_first_refresh()
-
     runtime_data[POWERWALL_COORDINATOR] = coordinator
 
+    await coordinator.async_config_entry_first_refresh()
+
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = runtime_data
 
-    hass.config_entries.async_setup_platforms(entry, PLATFORMS)
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    if base_info_data is None:
+        # The base info rarely changes, so setup used the cached copy,
+        # refresh it now that setup is done
+        refresh_task = hass.async_create_background_task(
+            _async_refresh_base_info(
+                hass, entry, power_wall, base_info_store, base_info, ip_address
+            ),
+            "powerwall base info refresh",
+        )
+        entry.async_on_unload(refresh_task.cancel)
 
     return True
 
 
-def _login_and_fetch_base_info(
-    power_wall: Powerwall, host: str, password: str
-) -> PowerwallBaseInfo:
-    """Login to the powerwall and fetch the base info."""
-    if password is not None:
-        power_wall.login(password)
-    return call_base_info(power_wall, host)
+@callback
+def _async_create_http_session(hass: HomeAssistant) -> ClientSession:
+    """Create the http session used to talk to the powerwall."""
+    # The powerwall is addressed by ip and uses a self signed certificate,
+    # so the cookie jar must accept cookies for ip hosts.
+    return async_create_clientsession(
+        hass, verify_ssl=False, cookie_jar=CookieJar(unsafe=True)
+    )
 
 
-def call_base_info(power_wall: Powerwall, host: str) -> PowerwallBaseInfo:
-    """Return PowerwallBaseInfo for the device."""
-    # Make sure the serial numbers always have the same order
+@callback
+def _async_get_base_info_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Return the store for the cached base info of an entry."""
+    return Store(hass, BASE_INFO_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}")
+
+
+async def _login_and_fetch_base_info(
+    power_wall: Powerwall,
+    host: str,
+    password: str | None,
+    cached_data: dict[str, Any] | None,
+) -> tuple[PowerwallBaseInfo, dict[str, Any] | None]:
+    """Login to the powerwall and fetch the base info unless it is cached.
+
+    The fetched data is returned so it can be stored, or None if the
+    cached copy was used.
+    """
+    if password is not None:
+        await power_wall.login(password)
+    if cached_data is not None:
+        try:
+            return _base_info_from_data(cached_data, host), None
+        except (KeyError, TypeError, ValueError, PowerwallError) as err:
+            _LOGGER.debug("Discarding the cached powerwall base info: %s", err)
+    data = await _fetch_base_info_data(power_wall)
+    return _base_info_from_data(data, host), data
+
+
+async def _fetch_base_info_data(power_wall: Powerwall) -> dict[str, Any]:
+    """Fetch the base info in the format it is stored in."""
+    api = power_wall.get_api()
     gateway_din = None
     with contextlib.suppress(AssertionError, PowerwallError):
-        gateway_din = power_wall.get_gateway_din().upper()
+        gateway_din = (await power_wall.get_gateway_din()).upper()
+    return {
+        "gateway_din": gateway_din,
+        "site_info": await api.get_site_info(),
+        "status": await api.get_status(),
+        # Make sure the serial numbers always have the same order
+        "serial_numbers": sorted(await power_wall.get_serial_numbers()),
+    }
+
+
+def _base_info_from_data(data: dict[str, Any], host: str) -> PowerwallBaseInfo:
+    """Return PowerwallBaseInfo for the device."""
+    status = PowerwallStatusResponse.from_dict(data["status"])
     return PowerwallBaseInfo(
-        gateway_din=gateway_din,
-        site_info=power_wall.get_site_info(),
-        status=power_wall.get_status(),
-        device_type=power_wall.get_device_type(),
-        serial_numbers=sorted(power_wall.get_serial_numbers()),
+        gateway_din=data["gateway_din"],
+        site_info=SiteInfoResponse.from_dict(data["site_info"]),
+        status=status,
+        device_type=status.device_type,
+        serial_numbers=data["serial_numbers"],
         url=f"https://{host}",
     )
 
 
-def _fetch_powerwall_data(power_wall: Powerwall) -> PowerwallData:
+async def _async_refresh_base_info(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    power_wall: Powerwall,
+    store: Store,
+    base_info: PowerwallBaseInfo,
+    host: str,
+) -> None:
+    """Refresh the cached base info and reload if the device changed."""
+    try:
+        data = await _fetch_base_info_data(power_wall)
+        new_base_info = _base_info_from_data(data, host)
+    except PowerwallError as err:
+        _LOGGER.debug("Failed to refresh the powerwall base info: %s", err)
+        return
+    await store.async_save(data)
+    if _base_info_key(new_base_info) != _base_info_key(base_info):
+        _LOGGER.debug("The powerwall base info changed, reloading")
+        hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
+
+
+def _base_info_key(base_info: PowerwallBaseInfo) -> tuple:
+    """Return the parts of the base info the entities are built from."""
+    return (
+        base_info.gateway_din,
+        base_info.serial_numbers,
+        base_info.device_type,
+        base_info.status.version,
+        base_info.site_info.site_name,
+    )
+
+
+async def _fetch_grid_state(power_wall: Powerwall) -> tuple[GridStatus, bool]:
+    """Return the grid status and if grid services are active."""
+    # Both values come from the same endpoint so only request it once
+    grid_state = await power_wall.get_api().get_system_status_grid_status()
+    url = "system_status/grid_status"
+    return (
+        GridStatus(assert_attribute(grid_state, "grid_status", url)),
+        assert_attribute(grid_state, "grid_services_active", url),
+    )
+
+
+async def _fetch_powerwall_data(power_wall: Powerwall) -> PowerwallData:
     """Process and update powerwall data."""
+    # Each getter is a separate request so fire them all at once
+    (
+        charge,
+        site_master,
+        meters,
+        (grid_status, grid_services_active),
+        backup_reserve,
+    ) = await asyncio.gather(
+        power_wall.get_charge(),
+        power_wall.get_sitemaster(),
+        power_wall.get_meters(),
+        _fetch_grid_state(power_wall),
+        power_wall.get_backup_reserve_percentage(),
+    )
     return PowerwallData(
-        charge=power_wall.get_charge(),
-        site_master=power_wall.get_sitemaster(),
-        meters=power_wall.get_meters(),
-        grid_services_active=power_wall.is_grid_services_active(),
-        grid_status=power_wall.get_grid_status(),
-        backup_reserve=power_wall.get_backup_reserve_percentage(),
+        charge=charge,
+        site_master=site_master,
+        meters=meters,
+        grid_services_active=grid_services_active,
+        grid_status=grid_status,
+        backup_reserve=backup_reserve,
     )
 
 
@@ -237,9 +367,15 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
-    hass.data[DOMAIN][entry.entry_id][POWERWALL_HTTP_SESSION].close()
+    runtime_data: PowerwallRuntimeData = hass.data[DOMAIN][entry.entry_id]
+    await runtime_data[POWERWALL_HTTP_SESSION].close()
 
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the cached base info when the entry is removed."""
+    await _async_get_base_info_store(hass, entry).async_remove()
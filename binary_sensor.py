@@ -1,18 +1,76 @@
 """Support for powerwall binary sensors."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
 
 from tesla_powerwall import GridStatus, MeterType
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
+    BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .entity import PowerWallEntity
-from .models import PowerwallRuntimeData
+from .models import PowerwallData, PowerwallRuntimeData
+
+
+@dataclass
+class PowerwallBinarySensorEntityDescriptionMixin:
+    """Mixin for required keys."""
+
+    value_fn: Callable[[PowerwallData], bool]
+
+
+@dataclass
+class PowerwallBinarySensorEntityDescription(
+    BinarySensorEntityDescription, PowerwallBinarySensorEntityDescriptionMixin
+):
+    """Describes a powerwall binary sensor entity."""
+
+    available_fn: Callable[[PowerwallData], bool] = lambda data: True
+
+
+BINARY_SENSORS: tuple[PowerwallBinarySensorEntityDescription, ...] = (
+    PowerwallBinarySensorEntityDescription(
+        key="running",
+        name="Powerwall Status",
+        device_class=BinarySensorDeviceClass.POWER,
+        value_fn=lambda data: data.site_master.is_running,
+    ),
+    PowerwallBinarySensorEntityDescription(
+        key="grid_services_active",
+        name="Grid Services Active",
+        device_class=BinarySensorDeviceClass.POWER,
+        value_fn=lambda data: data.grid_services_active,
+    ),
+    PowerwallBinarySensorEntityDescription(
+        key="grid_status",
+        name="Grid Status",
+        device_class=BinarySensorDeviceClass.POWER,
+        value_fn=lambda data: data.grid_status == GridStatus.CONNECTED,
+    ),
+    PowerwallBinarySensorEntityDescription(
+        key="connected_to_tesla",
+        name="Powerwall Connected to Tesla",
+        device_class=BinarySensorDeviceClass.CONNECTIVITY,
+        value_fn=lambda data: data.site_master.is_connected_to_tesla,
+    ),
+    PowerwallBinarySensorEntityDescription(
+        key="powerwall_charging",
+        name="Powerwall Charging",
+        device_class=BinarySensorDeviceClass.BATTERY_CHARGING,
+        # is_sending_to returns true when power flows into the battery
+        value_fn=lambda data: data.meters.get_meter(MeterType.BATTERY).is_sending_to(),
+        # Not available if no battery is installed
+        available_fn=lambda data: data.meters.get_meter(MeterType.BATTERY) is not None,
+    ),
+)
 
 
 async def async_setup_entry(
@@ -24,108 +82,45 @@ async def async_setup_entry(
     powerwall_data: PowerwallRuntimeData = hass.data[DOMAIN][config_entry.entry_id]
     async_add_entities(
         [
-            sensor_class(powerwall_data)
-            for sensor_class in (
-                PowerWallRunningSensor,
-                PowerWallGridServicesActiveSensor,
-                PowerWallGridStatusSensor,
-                PowerWallConnectedSensor,
-                PowerWallChargingStatusSensor,
-            )
+            PowerWallBinarySensor(powerwall_data, description)
+            for description in BINARY_SENSORS
         ]
     )
 
 
-class PowerWallRunningSensor(PowerWallEntity, BinarySensorEntity):
-    """Representation of an Powerwall running sensor."""
-
-    _attr_name = "Powerwall Status"
-    _attr_device_class = BinarySensorDeviceClass.POWER
-
-    @property
-    def unique_id(self) -> str:
-        """Device Uniqueid."""
-        return f"{self.base_unique_id}_running"
-
-    @property
-    def is_on(self) -> bool:
-        """Get the powerwall running state."""
-        return self.data.site_master.is_running
-
-
-class PowerWallConnectedSensor(PowerWallEntity, BinarySensorEntity):
-    """Representation of an Powerwall connected sensor."""
+class PowerWallBinarySensor(PowerWallEntity, BinarySensorEntity):
+    """Representation of a Powerwall binary sensor."""
 
-    _attr_name = "Powerwall Connected to Tesla"
-    _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
+    entity_description: PowerwallBinarySensorEntityDescription
 
-    @property
-    def unique_id(self) -> str:
-        """Device Uniqueid."""
-        return f"{self.base_unique_id}_connected_to_tesla"
-
-    @property
-    def is_on(self) -> bool:
-        """Get the powerwall connected to tesla state."""
-        return self.data.site_master.is_connected_to_tesla
-
-
-class PowerWallGridServicesActiveSensor(PowerWallEntity, BinarySensorEntity):
-    """Representation of a Powerwall grid services active sensor."""
-
-    _attr_name = "Grid Services Active"
-    _attr_device_class = BinarySensorDeviceClass.POWER
-
-    @property
-    def unique_id(self) -> str:
-        """Device Uniqueid."""
-        return f"{self.base_unique_id}_grid_services_active"
-
-    @property
-    def is_on(self) -> bool:
-        """Grid services is active."""
-        return self.data.grid_services_active
-
-
-class PowerWallGridStatusSensor(PowerWallEntity, BinarySensorEntity):
-    """Representation of an Powerwall grid status sensor."""
-
-    _attr_name = "Grid Status"
-    _attr_device_class = BinarySensorDeviceClass.POWER
-
-    @property
-    def unique_id(self) -> str:
-        """Device Uniqueid."""
-        return f"{self.base_unique_id}_grid_status"
-
-    @property
-    def is_on(self) -> bool:
-        """Grid is online."""
-        return self.data.grid_status == GridStatus.CONNECTED
-
-
-class PowerWallChargingStatusSensor(PowerWallEntity, BinarySensorEntity):
-    """Representation of an Powerwall charging status sensor."""
-
-    _attr_name = "Powerwall Charging"
-    _attr_device_class = BinarySensorDeviceClass.BATTERY_CHARGING
+    def __init__(
+        self,
+        powerwall_data: PowerwallRuntimeData,
+        description: PowerwallBinarySensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(powerwall_data)
+        self.entity_description = description
+        self._attr_unique_id = f"{self.base_unique_id}_{description.key}"
+        self._data_available = False
+        self._async_update_attrs()
 
     @property
     def available(self) -> bool:
-        """Powerwall is available."""
-        # Return False if no battery is installed
-        return (
-            super().available
-            and self.data.meters.get_meter(MeterType.BATTERY) is not None
-        )
-
-    @property
-    def unique_id(self) -> str:
-        """Device Uniqueid."""
-        return f"{self.base_unique_id}_powerwall_charging"
-
-    @property
-    def is_on(self) -> bool:
-        """Powerwall is charging."""
-        # is_sending_to returns true for values greater than 100 watts
-        return self.data.meters.get_meter(MeterType.BATTERY).is_sending_to()
+        """Return if the sensor is available."""
+        return super().available and self._data_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._async_update_attrs()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the state from the latest coordinator data."""
+        data = self.data
+        description = self.entity_description
+        self._data_available = description.available_fn(data)
+        if self._data_available:
+            self._attr_is_on = description.value_fn(data)
@@ -4,12 +4,13 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from aiohttp import CookieJar
 from tesla_powerwall import (
     AccessDeniedError,
     MissingAttributeError,
     Powerwall,
     PowerwallUnreachableError,
-    SiteInfo,
+    SiteInfoResponse,
 )
 import voluptuous as vol
 
@@ -17,6 +18,7 @@ from homeassistant import config_entries, core, exceptions
 from homeassistant.components import dhcp
 from homeassistant.const import CONF_IP_ADDRESS, CONF_PASSWORD
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
 from homeassistant.util.network import is_ip_address
 
 from .const import DOMAIN
@@ -24,13 +26,13 @@ from .const import DOMAIN
 _LOGGER = logging.getLogger(__name__)
 
 
-def _login_and_fetch_site_info(
+async def _login_and_fetch_site_info(
     power_wall: Powerwall, password: str
-) -> tuple[SiteInfo, str]:
+) -> tuple[SiteInfoResponse, str]:
     """Login to the powerwall and fetch the base info."""
     if password is not None:
-        power_wall.login(password)
-    return power_wall.get_site_info(), power_wall.get_gateway_din()
+        await power_wall.login(password)
+    return await power_wall.get_site_info(), await power_wall.get_gateway_din()
 
 
 async def validate_input(
@@ -41,17 +43,24 @@ async def validate_input(
     Data has the keys from schema with values provided by the user.
     """
 
-    power_wall = Powerwall(data[CONF_IP_ADDRESS])
     password = data[CONF_PASSWORD]
+    # Same session setup as the integration, the cookie jar must
+    # accept the auth cookie for ip hosts.
+    http_session = async_create_clientsession(
+        hass, verify_ssl=False, cookie_jar=CookieJar(unsafe=True)
+    )
+    power_wall = Powerwall(data[CONF_IP_ADDRESS], http_session=http_session)
 
     try:
-        site_info, gateway_din = await hass.async_add_executor_job(
-            _login_and_fetch_site_info, power_wall, password
+        site_info, gateway_din = await _login_and_fetch_site_info(
+            power_wall, password
         )
     except MissingAttributeError as err:
         # Only log the exception without the traceback
         _LOGGER.error(str(err))
         raise WrongVersion from err
+    finally:
+        await http_session.close()
 
     # Return info that you want to store in the config entry.
     return {"title": site_info.site_name, "unique_id": gateway_din.upper()}
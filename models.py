@@ -4,14 +4,14 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TypedDict
 
-from requests import Session
+from aiohttp import ClientSession
 from tesla_powerwall import (
     DeviceType,
     GridStatus,
-    MetersAggregates,
-    PowerwallStatus,
-    SiteInfo,
-    SiteMaster,
+    MetersAggregatesResponse,
+    PowerwallStatusResponse,
+    SiteInfoResponse,
+    SiteMasterResponse,
 )
 
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
@@ -22,8 +22,8 @@ class PowerwallBaseInfo:
     """Base information for the powerwall integration."""
 
     gateway_din: None | str
-    site_info: SiteInfo
-    status: PowerwallStatus
+    site_info: SiteInfoResponse
+    status: PowerwallStatusResponse
     device_type: DeviceType
     serial_numbers: list[str]
     url: str
@@ -34,8 +34,8 @@ class PowerwallData:
     """Point in time data for the powerwall integration."""
 
     charge: float
-    site_master: SiteMaster
-    meters: MetersAggregates
+    site_master: SiteMasterResponse
+    meters: MetersAggregatesResponse
     grid_services_active: bool
     grid_status: GridStatus
     backup_reserve: float
@@ -48,4 +48,4 @@ class PowerwallRuntimeData(TypedDict):
     login_failed_count: int
     base_info: PowerwallBaseInfo
     api_changed: bool
-    http_session: Session
+    http_session: ClientSession
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from tesla_powerwall import Meter, MeterType
+from tesla_powerwall import MeterResponse, MeterType
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -71,10 +71,10 @@ class PowerWallChargeSensor(PowerWallEntity, SensorEntity):
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_device_class = SensorDeviceClass.BATTERY
 
-    @property
-    def unique_id(self) -> str:
-        """Device Uniqueid."""
-        return f"{self.base_unique_id}_charge"
+    def __init__(self, powerwall_data: PowerwallRuntimeData) -> None:
+        """Initialize the sensor."""
+        super().__init__(powerwall_data)
+        self._attr_unique_id = f"{self.base_unique_id}_charge"
 
     @property
     def native_value(self) -> int:
@@ -109,7 +109,7 @@ class PowerWallEnergySensor(PowerWallEntity, SensorEntity):
         meter = self.data.meters.get_meter(self._meter)
         return {
             ATTR_FREQUENCY: round(meter.frequency, 1),
-            ATTR_INSTANT_AVERAGE_VOLTAGE: round(meter.average_voltage, 1),
+            ATTR_INSTANT_AVERAGE_VOLTAGE: round(meter.instant_average_voltage, 1),
             ATTR_INSTANT_TOTAL_CURRENT: meter.get_instant_total_current(),
             ATTR_IS_ACTIVE: meter.is_active(),
         }
@@ -123,10 +123,10 @@ class PowerWallBackupReserveSensor(PowerWallEntity, SensorEntity):
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_device_class = SensorDeviceClass.BATTERY
 
-    @property
-    def unique_id(self) -> str:
-        """Device Uniqueid."""
-        return f"{self.base_unique_id}_backup_reserve"
+    def __init__(self, powerwall_data: PowerwallRuntimeData) -> None:
+        """Initialize the sensor."""
+        super().__init__(powerwall_data)
+        self._attr_unique_id = f"{self.base_unique_id}_backup_reserve"
 
     @property
     def native_value(self) -> int:
@@ -164,7 +164,7 @@ class PowerWallEnergyDirectionSensor(PowerWallEntity, SensorEntity):
         return super().available and self.native_value != 0
 
     @property
-    def meter(self) -> Meter:
+    def meter(self) -> MeterResponse:
         """Get the meter for the sensor."""
         return self.data.meters.get_meter(self._meter)
 